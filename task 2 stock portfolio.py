@@ -1,6 +1,11 @@
+import math
+import os
+import threading
+import time
+# Taken before importing tkinter on purpose, so first paint includes its load time
+START_TIME = time.perf_counter()
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import csv, json
 from datetime import datetime
 from collections import defaultdict
 
@@ -8,6 +13,34 @@ from collections import defaultdict
 STOCKS = {"AAPL": 180.25, "TSLA": 250.50, "GOOGL": 140.75, "MSFT": 380.90, 
           "AMZN": 145.30, "META": 320.45, "NVDA": 450.60, "JPM": 155.20, "V": 260.80, "WMT": 165.40}
 
+# Remembers the path of the last saved/loaded portfolio
+LAST_FILE = os.path.join(os.path.expanduser("~"), ".portfolio_tracker_last")
+
+def clean_portfolio(data):
+    """Return the known-ticker holdings of a loaded portfolio, or None if malformed."""
+    if not isinstance(data, dict):
+        return None
+    
+    holdings = {}
+    for ticker, holding in data.items():
+        if ticker not in STOCKS:
+            continue
+        if not isinstance(holding, dict):
+            return None
+        
+        # Same rule as add_stock: a positive whole number of shares
+        qty = holding.get('qty')
+        if isinstance(qty, bool) or not isinstance(qty, int) or qty <= 0:
+            return None
+        for key in ('total_cost', 'avg_cost'):
+            cost = holding.get(key)
+            if isinstance(cost, bool) or not isinstance(cost, (int, float)):
+                return None
+            if not math.isfinite(cost) or cost < 0:
+                return None
+        holdings[ticker] = holding
+    return holdings
+
 class PortfolioTracker:
     def __init__(self, root):
         self.root = root
@@ -15,8 +48,96 @@ class PortfolioTracker:
         self.root.geometry("1000x700")
         
         self.portfolio = {}
+        self.summary_text = None
+        self.dist_text = None
+        self.restored = None
+        self.restoring = False
+        self.restore_cancelled = False
+        self.pending_save = None
+        self.first_paint = ""
         self.setup_ui()
+        
+        # Report first paint, then restore the last portfolio off the UI thread
+        self.root.bind('<Map>', self.on_first_paint)
+    
+    def on_first_paint(self, event):
+        # <Map> on the root also fires for every child widget
+        if event.widget is not self.root:
+            return
+        self.root.unbind('<Map>')
+        
+        elapsed = (time.perf_counter() - START_TIME) * 1000
+        self.first_paint = f"first paint in {elapsed:.0f} ms"
+        self.status_var.set(f"Ready ({self.first_paint})")
+        
+        filename = self.last_filename()
+        if filename:
+            self.restoring = True
+            self.status_var.set(f"Restoring {filename}... ({self.first_paint})")
+            threading.Thread(target=self.read_snapshot, args=(filename,), daemon=True).start()
+            self.root.after(50, self.apply_snapshot)
+    
+    def last_filename(self):
+        try:
+            with open(LAST_FILE, 'r') as f:
+                filename = f.read().strip()
+        except OSError:
+            return None
+        return filename if os.path.isfile(filename) else None
+    
+    def remember_filename(self, filename):
+        try:
+            with open(LAST_FILE, 'w') as f:
+                f.write(filename)
+        except OSError:
+            pass
+    
+    def read_snapshot(self, filename):
+        import json
+        try:
+            with open(filename, 'r') as f:
+                self.restored = (filename, clean_portfolio(json.load(f)))
+        except Exception:
+            # Any failure must still end the apply_snapshot poll
+            self.restored = (filename, None)
+    
+    def apply_snapshot(self):
+        # A manual load supersedes the stale snapshot
+        if self.restore_cancelled:
+            return
+        
+        # Tk is not thread-safe, so poll for the reader thread's result
+        if self.restored is None:
+            self.root.after(50, self.apply_snapshot)
+            return
+        
+        self.restoring = False
+        filename, data = self.restored
+        if data is None:
+            self.status_var.set(f"Could not restore {filename} ({self.first_paint})")
+            self.finish_pending_save()
+            return
+        
+        # Keep anything the user added while the snapshot was loading
+        for ticker, holding in self.portfolio.items():
+            if ticker in data:
+                old = data[ticker]
+                data[ticker] = {
+                    'qty': old['qty'] + holding['qty'],
+                    'total_cost': old['total_cost'] + holding['total_cost'],
+                    'avg_cost': (old['total_cost'] + holding['total_cost']) / (old['qty'] + holding['qty'])
+                }
+            else:
+                data[ticker] = holding
+        self.portfolio = data
         self.update_display()
+        self.status_var.set(f"Restored {filename} ({self.first_paint})")
+        self.finish_pending_save()
+    
+    def finish_pending_save(self):
+        if self.pending_save:
+            filename, self.pending_save = self.pending_save, None
+            self.write_portfolio(filename)
     
     def setup_ui(self):
         # Menu
@@ -78,27 +199,31 @@ class PortfolioTracker:
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Right panel - Analytics
-        right_frame = ttk.Frame(main_frame)
-        right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
+        # Right panel - Analytics (panels are built on first use)
+        self.right_frame = ttk.Frame(main_frame)
+        self.right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
+        
+        # Status bar
+        self.status_var = tk.StringVar(value="Ready")
+        ttk.Label(self.root, textvariable=self.status_var, relief=tk.SUNKEN).pack(fill=tk.X, side=tk.BOTTOM)
+    
+    def setup_analytics(self):
+        if self.summary_text is not None:
+            return
         
         # Summary
-        summary_frame = ttk.LabelFrame(right_frame, text="Portfolio Summary", padding=10)
+        summary_frame = ttk.LabelFrame(self.right_frame, text="Portfolio Summary", padding=10)
         summary_frame.pack(fill=tk.X, pady=(0, 10))
         
         self.summary_text = tk.Text(summary_frame, height=8, width=40, font=('Courier', 10))
         self.summary_text.pack(fill=tk.X)
         
         # Distribution
-        dist_frame = ttk.LabelFrame(right_frame, text="Distribution", padding=10)
+        dist_frame = ttk.LabelFrame(self.right_frame, text="Distribution", padding=10)
         dist_frame.pack(fill=tk.BOTH, expand=True)
         
         self.dist_text = tk.Text(dist_frame, height=15, width=40, font=('Courier', 10))
         self.dist_text.pack(fill=tk.BOTH, expand=True)
-        
-        # Status bar
-        self.status_var = tk.StringVar(value="Ready")
-        ttk.Label(self.root, textvariable=self.status_var, relief=tk.SUNKEN).pack(fill=tk.X, side=tk.BOTTOM)
     
     def update_price(self, *args):
         ticker = self.stock_var.get()
@@ -154,6 +279,8 @@ class PortfolioTracker:
             self.status_var.set(f"Removed {ticker}")
     
     def update_display(self):
+        self.setup_analytics()
+        
         # Clear tree
         for item in self.tree.get_children():
             self.tree.delete(item)
@@ -233,23 +360,52 @@ class PortfolioTracker:
     def save_portfolio(self):
         filename = filedialog.asksaveasfilename(defaultextension=".json", 
                                                filetypes=[("JSON", "*.json")])
-        if filename:
-            with open(filename, 'w') as f:
-                json.dump(self.portfolio, f)
-            self.status_var.set(f"Saved to {filename}")
+        if not filename:
+            return
+        
+        # Saving now would write only this session's holdings, so wait for the restore
+        if self.restoring:
+            self.pending_save = filename
+            self.status_var.set(f"Will save to {filename} once the restore finishes")
+            return
+        self.write_portfolio(filename)
+    
+    def write_portfolio(self, filename):
+        import json
+        with open(filename, 'w') as f:
+            json.dump(self.portfolio, f)
+        self.remember_filename(filename)
+        self.status_var.set(f"Saved to {filename}")
     
     def load_portfolio(self):
         filename = filedialog.askopenfilename(filetypes=[("JSON", "*.json")])
         if filename:
-            with open(filename, 'r') as f:
-                self.portfolio = json.load(f)
+            import json
+            try:
+                with open(filename, 'r') as f:
+                    data = clean_portfolio(json.load(f))
+            except (OSError, ValueError):
+                data = None
+            if data is None:
+                messagebox.showerror("Error", "Invalid portfolio file")
+                return
+            self.portfolio = data
+            self.remember_filename(filename)
             self.update_display()
             self.status_var.set(f"Loaded from {filename}")
+            
+            if self.restoring:
+                self.restoring = False
+                self.restore_cancelled = True
+                if self.pending_save:
+                    self.status_var.set(f"Loaded from {filename} (pending save to {self.pending_save} abandoned)")
+                    self.pending_save = None
     
     def export_csv(self):
         filename = filedialog.asksaveasfilename(defaultextension=".csv", 
                                                filetypes=[("CSV", "*.csv")])
         if filename:
+            import csv
             with open(filename, 'w', newline='') as f:
                 writer = csv.writer(f)
                 writer.writerow(['Ticker', 'Quantity', 'Avg Cost', 'Current Price', 'Value', 'Gain/Loss'])